@@ -1,15 +1,65 @@
 """
 Game loop and GIF generation.
 """
+import io
+from functools import partial
 from typing import Generator, Optional
 from PIL import Image
 from .game_state import GameState
+from .physics import warmup_kernels
 from .renderer import Renderer
 from .strategies import BaseStrategy, FollowBallStrategy
 from .models import ContributionData, RenderContext
 from .constants import *
 
 
+def _build_master_palette() -> Image.Image:
+    """
+    Build the shared GIF palette from the game's fixed color scheme.
+
+    The scene only ever contains the background, grid, paddle, ball,
+    watermark, brick colors (plus their damage-fade steps) and explosion
+    fade steps, so one palette serves every frame. This replaces a
+    median-cut run per frame with a fast LUT remap and keeps palettes
+    consistent across frames, which also compresses better.
+    """
+    colors = [
+        COLOR_BACKGROUND,
+        COLOR_GRID,
+        COLOR_PADDLE,
+        COLOR_BALL,
+        (255, 255, 255),    # Explosion flash
+        (0, 0, 0),          # Watermark shadow
+        (150, 150, 150),    # Watermark text
+    ]
+
+    # Brick colors at every damage-fade step
+    for level, config in CONTRIBUTION_LEVELS.items():
+        if not config['color']:
+            continue
+        for strength in range(1, level + 1):
+            fade_factor = 0.7 + (0.3 * strength / level)
+            colors.append(tuple(min(255, int(c * fade_factor)) for c in config['color']))
+        colors.append(config['color'])
+
+    # Explosion particle fade steps
+    for step in range(1, 17):
+        intensity = step / 16
+        colors.append(tuple(int(c * intensity) for c in COLOR_EXPLOSION))
+
+    # Deduplicate while preserving order
+    unique_colors = list(dict.fromkeys(colors))
+
+    palette = []
+    for color in unique_colors:
+        palette.extend(color)
+    palette.extend([0] * (768 - len(palette)))
+
+    master = Image.new('P', (1, 1))
+    master.putpalette(palette)
+    return master
+
+
 class Animator:
     """Orchestrates game simulation and GIF generation."""
     
@@ -43,20 +93,65 @@ class Animator:
         
         # Initialize renderer
         self.renderer = Renderer(self.render_context)
-    
+
+        # Pay the one-time JIT compile cost before the frame loop starts
+        warmup_kernels()
+
+        # Pre-bound render callables: the renderer, game state, and
+        # watermark text are fixed for the animator's lifetime, so the
+        # per-frame calls skip the repeated attribute and argument setup.
+        self._render = partial(self.renderer.render_frame, self.game_state)
+        self._apply_watermark = (
+            partial(self.renderer.add_watermark, text=watermark)
+            if watermark else None
+        )
+
+        # Memoized last frame: visually identical consecutive frames are
+        # reused instead of re-rendered
+        self._last_frame: Optional[Image.Image] = None
+        self._last_frame_key = None
+
+    def _render_frame(self) -> Image.Image:
+        """
+        Render the current game state, reusing the previous frame when the
+        visible state (integer entity positions, brick count) is unchanged.
+        The GIF still needs a frame per tick for timing; only the drawing
+        is skipped.
+        """
+        game_state = self.game_state
+
+        if game_state.explosions or game_state.has_dirty_bricks():
+            # Explosions animate every frame and hit bricks change the base
+            key = None
+        else:
+            key = (
+                int(game_state.ball.x),
+                int(game_state.ball.y),
+                int(game_state.paddle.x),
+                game_state.destroyed_bricks,
+            )
+
+        if key is not None and key == self._last_frame_key:
+            return self._last_frame
+
+        frame = self._render()
+        if self._apply_watermark is not None:
+            frame = self._apply_watermark(frame)
+
+        self._last_frame = frame
+        self._last_frame_key = key
+        return frame
+
     def generate_frames(self) -> Generator[Image.Image, None, None]:
         """
         Generate frames for the game simulation.
-        
+
         Yields:
             PIL Image objects for each frame
         """
         # Yield initial frame
-        frame = self.renderer.render_frame(self.game_state)
-        if self.watermark:
-            frame = self.renderer.add_watermark(frame, self.watermark)
-        yield frame
-        
+        yield self._render_frame()
+
         if isinstance(self.strategy, FollowBallStrategy):
             # Reactive loop: keep updating paddle target to track the ball.
             while not self.game_state.is_complete():
@@ -75,12 +170,9 @@ class Animator:
 
                 self.game_state.paddle.move_to(ball.x + lead)
                 self.game_state.animate()
-                
-                frame = self.renderer.render_frame(self.game_state)
-                if self.watermark:
-                    frame = self.renderer.add_watermark(frame, self.watermark)
-                yield frame
-                
+
+                yield self._render_frame()
+
                 if self.game_state.frame_count >= MAX_FRAMES:
                     break
         else:
@@ -91,22 +183,25 @@ class Animator:
                 # Set paddle target
                 self.game_state.paddle.move_to(action.target_x)
                 
-                # Animate until paddle can take next action
+                # Animate until paddle can take next action. Always advance
+                # at least one frame: if the paddle is already at the
+                # target, the strategy would otherwise re-yield the same
+                # action forever without the simulation progressing.
                 frames_since_action = 0
-                while not self.game_state.can_take_action():
+                while True:
                     self.game_state.animate()
-                    
-                    frame = self.renderer.render_frame(self.game_state)
-                    if self.watermark:
-                        frame = self.renderer.add_watermark(frame, self.watermark)
-                    yield frame
-                    
+
+                    yield self._render_frame()
+
                     frames_since_action += 1
-                    
+
+                    if self.game_state.can_take_action():
+                        break
+
                     # Safety: break if stuck
                     if frames_since_action > 500:
                         break
-                
+
                 # Safety: check frame count
                 if self.game_state.frame_count >= MAX_FRAMES:
                     break
@@ -115,20 +210,14 @@ class Animator:
         force_kill_countdown = 100
         while not self.game_state.is_complete() and force_kill_countdown > 0:
             self.game_state.animate()
-            
-            frame = self.renderer.render_frame(self.game_state)
-            if self.watermark:
-                frame = self.renderer.add_watermark(frame, self.watermark)
-            yield frame
-            
+
+            yield self._render_frame()
+
             force_kill_countdown -= 1
         
-        # Yield pause frames at end
+        # Yield pause frames at end (memoized: the state no longer changes)
         for _ in range(END_PAUSE_FRAMES):
-            frame = self.renderer.render_frame(self.game_state)
-            if self.watermark:
-                frame = self.renderer.add_watermark(frame, self.watermark)
-            yield frame
+            yield self._render_frame()
     
     def generate_gif(self, output_path: str):
         """
@@ -138,31 +227,43 @@ class Animator:
             output_path: Path to save GIF file
         """
         print(f"Generating frames for {self.contribution_data.username}...")
+
+        # Convert frames to paletted mode as they are produced, so only the
+        # small paletted frames accumulate in memory (never the RGB
+        # originals). Each frame must be paletted before the next render:
+        # the renderer reuses one persistent canvas, so the RGB image is
+        # only valid until the following render_frame call. With a fixed
+        # palette and no dithering this is a fast per-pixel LUT remap.
+        master_palette = _build_master_palette()
+
+        paletted_frames = [
+            frame.quantize(palette=master_palette, dither=Image.Dither.NONE)
+            for frame in self.generate_frames()
+        ]
+
+        print(f"Generated {len(paletted_frames)} frames")
         
-        # Generate all frames
-        frames = list(self.generate_frames())
-        
-        print(f"Generated {len(frames)} frames")
-        
-        # Convert frames to paletted mode for GIF
-        paletted_frames = []
-        for frame in frames:
-            paletted = frame.convert('P', palette=Image.ADAPTIVE)
-            paletted_frames.append(paletted)
-        
-        # Save as GIF
+        # Save as GIF. Encode into an in-memory buffer first (one file
+        # write instead of many small ones). Because every frame shares the
+        # master palette, Pillow's writer encodes only the changed
+        # subrectangle of each frame, so the moving ball/paddle cost a few
+        # hundred bytes per frame rather than a full image.
         print(f"Saving GIF to {output_path}...")
+        buffer = io.BytesIO()
         paletted_frames[0].save(
-            output_path,
+            buffer,
+            format='GIF',
             save_all=True,
             append_images=paletted_frames[1:],
             duration=self.frame_duration,
             loop=0,
-            optimize=False
+            optimize=True
         )
+        with open(output_path, 'wb') as f:
+            f.write(buffer.getbuffer())
         
         print(f"✓ GIF saved: {output_path}")
         print(f"  Total bricks: {self.game_state.total_bricks}")
         print(f"  Destroyed: {self.game_state.destroyed_bricks}")
-        print(f"  Frames: {len(frames)}")
-        print(f"  Duration: {len(frames) * self.frame_duration / 1000:.1f}s")
+        print(f"  Frames: {len(paletted_frames)}")
+        print(f"  Duration: {len(paletted_frames) * self.frame_duration / 1000:.1f}s")
@@ -2,6 +2,7 @@
 Core constants for Commit Breakout game.
 All values tuned for 40 FPS default frame rate.
 """
+import numpy as np
 
 # Grid and Layout
 NUM_WEEKS = 52          # Contribution graph weeks (columns)
@@ -36,7 +37,7 @@ PADDLE_FOLLOW_MAX_OFFSET = PADDLE_WIDTH * 0.35  # Max follow offset from ball x
 # Game Positioning (in grid units)
 PADDLE_ROW = NUM_DAYS + 3  # Paddle row position (below grid)
 BALL_START_ROW = PADDLE_ROW - 1  # Ball starting row
-BALL_START_COL = NUM_WEEKS / 2   # Ball starting column (center)
+BALL_START_COL = NUM_WEEKS // 2  # Ball starting column (center)
 
 # Animation
 DEFAULT_FPS = 40        # Frames per second
@@ -44,13 +45,24 @@ FRAME_DURATION_MS = int(1000 / DEFAULT_FPS)  # 25ms per frame
 MAX_FRAMES = 5000       # Safety limit for frame generation
 END_PAUSE_FRAMES = 60   # Frames to show after completion (1.5 sec)
 
-# Contribution Level Mapping
+# Contribution Level Mapping, indexed by level 0-4 as contiguous arrays
+# for vectorized brick construction (level 0 = no contribution = no brick)
+LEVEL_COLORS = np.array([
+    [0, 0, 0],          # No contribution (unused)
+    [14, 68, 41],       # 1-3 commits (dark green)
+    [0, 109, 50],       # 4-9 commits
+    [38, 166, 65],      # 10-19 commits
+    [57, 211, 83],      # 20+ commits (bright green)
+], dtype=np.uint8)
+LEVEL_STRENGTH = np.array([0, 1, 2, 3, 4], dtype=np.int8)
+
+# Compatibility alias in the original dict-of-dicts shape
 CONTRIBUTION_LEVELS = {
-    0: {"strength": 0, "color": None},                    # No contribution
-    1: {"strength": 1, "color": (14, 68, 41)},           # 1-3 commits (dark green)
-    2: {"strength": 2, "color": (0, 109, 50)},           # 4-9 commits
-    3: {"strength": 3, "color": (38, 166, 65)},          # 10-19 commits
-    4: {"strength": 4, "color": (57, 211, 83)},          # 20+ commits (bright green)
+    level: {
+        "strength": int(LEVEL_STRENGTH[level]),
+        "color": tuple(int(c) for c in LEVEL_COLORS[level]) if level else None,
+    }
+    for level in range(len(LEVEL_STRENGTH))
 }
 
 # Color Scheme (Dark Mode)
@@ -9,7 +9,9 @@ from .models import RenderContext
 
 class Ball:
     """Represents the game ball with physics."""
-    
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'radius')
+
     def __init__(self, x: float, y: float, vx: float, vy: float):
         """
         Initialize ball.
@@ -50,7 +52,12 @@ class Ball:
 
 class Paddle:
     """Represents the player paddle (AI-controlled)."""
-    
+
+    __slots__ = ('x', 'y', 'width', 'height', 'target_x', 'speed', '_bounce_lut')
+
+    # LUT resolution: entries for normalized offsets -1.0..1.0 in 1/32 steps
+    _BOUNCE_LUT_HALF = 32
+
     def __init__(self, x: float, y: float, width: float):
         """
         Initialize paddle.
@@ -66,6 +73,17 @@ class Paddle:
         self.height = PADDLE_HEIGHT
         self.target_x = x
         self.speed = PADDLE_SPEED
+
+        # Precomputed bounce velocities indexed by quantized offset from the
+        # paddle center; replaces per-hit radians/sin/cos with a lookup
+        half = self._BOUNCE_LUT_HALF
+        self._bounce_lut = tuple(
+            (
+                BALL_SPEED * math.sin(math.radians(n / half * BOUNCE_ANGLE_MAX)),
+                -abs(BALL_SPEED * math.cos(math.radians(n / half * BOUNCE_ANGLE_MAX)))
+            )
+            for n in range(-half, half + 1)
+        )
     
     def move_to(self, target_x: float):
         """Set target position for paddle to move toward."""
@@ -109,16 +127,11 @@ class Paddle:
         offset = ball_x - self.x
         max_offset = self.width / 2
         normalized_offset = max(min(offset / max_offset, 1.0), -1.0)
-        
-        # Calculate bounce angle (max BOUNCE_ANGLE_MAX degrees from vertical)
-        angle_degrees = normalized_offset * BOUNCE_ANGLE_MAX
-        angle_radians = math.radians(angle_degrees)
-        
-        # Convert to velocity components
-        vx = BALL_SPEED * math.sin(angle_radians)
-        vy = -abs(BALL_SPEED * math.cos(angle_radians))  # Always upward
-        
-        return vx, vy
+
+        # Look up the precomputed (vx, vy) for the quantized offset; the
+        # 1/32 steps are visually indistinguishable from the exact angle
+        half = self._BOUNCE_LUT_HALF
+        return self._bounce_lut[int(round(normalized_offset * half)) + half]
     
     def draw(self, draw_context, render_context: RenderContext):
         """Draw paddle on PIL image."""
@@ -135,7 +148,11 @@ class Paddle:
 
 class Brick:
     """Represents a contribution brick."""
-    
+
+    __slots__ = ('col', 'row', 'strength', 'max_strength', 'color',
+                 'contribution_count', 'destroyed', '_bounds',
+                 '_color_by_strength')
+
     def __init__(self, col: int, row: int, strength: int, color: tuple, contribution_count: int):
         """
         Initialize brick.
@@ -153,6 +170,16 @@ class Brick:
         self.color = color
         self.contribution_count = contribution_count
         self.destroyed = False
+        self._bounds = None  # Lazily cached pixel bounds; bricks never move
+
+        # Precomputed damage-fade colors indexed by remaining strength, so
+        # draw() never recomputes the fade per frame (darken slightly when
+        # damaged; full color at full strength)
+        self._color_by_strength = tuple(
+            tuple(int(c * (0.7 + 0.3 * s / strength)) for c in color)
+            if s < strength else color
+            for s in range(strength + 1)
+        )
     
     def take_damage(self, amount: int = 1) -> bool:
         """
@@ -181,23 +208,23 @@ class Brick:
     
     def get_pixel_bounds(self, render_context: RenderContext) -> Tuple[float, float, float, float]:
         """Get brick bounding box in pixels (left, top, right, bottom)."""
-        return render_context.get_cell_rect(self.col, self.row)
+        if self._bounds is None:
+            self._bounds = render_context.get_cell_rect(self.col, self.row)
+        return self._bounds
     
+    def current_color(self) -> tuple:
+        """Get the precomputed fade color for the remaining strength."""
+        return self._color_by_strength[self.strength]
+
     def draw(self, draw_context, render_context: RenderContext):
         """Draw brick on PIL image."""
         if self.destroyed:
             return
-        
+
         left, top, right, bottom = self.get_pixel_bounds(render_context)
-        
-        # Calculate color intensity based on remaining strength
-        # (Optionally fade color as brick takes damage)
-        color = self.color
-        if self.strength < self.max_strength:
-            # Darken slightly when damaged
-            fade_factor = 0.7 + (0.3 * self.strength / self.max_strength)
-            color = tuple(int(c * fade_factor) for c in color)
-        
+
+        color = self.current_color()
+
         draw_context.rectangle(
             [left, top, right, bottom],
             fill=color,
@@ -207,7 +234,9 @@ class Brick:
 
 class Explosion:
     """Visual effect when brick is destroyed."""
-    
+
+    __slots__ = ('x', 'y', 'duration', 'current_frame', 'max_radius', 'particles')
+
     def __init__(self, x: float, y: float, duration_frames: int = 10):
         """
         Initialize explosion.
@@ -224,16 +253,26 @@ class Explosion:
         self.particles = self._generate_particles()
     
     def _generate_particles(self) -> List[Tuple[float, float, float]]:
-        """Generate particle positions and angles."""
+        """Generate particle direction vectors.
+
+        The angles are fixed for the explosion's life, so the (cos, sin)
+        pair is folded into the speed up front; per-frame positioning is
+        then a multiply-add per particle.
+        """
         import random
         particles = []
         num_particles = 12
-        
+
         for i in range(num_particles):
             angle = (i / num_particles) * 2 * math.pi
             speed = random.uniform(0.5, 1.5)
-            particles.append((angle, speed, random.uniform(0.7, 1.0)))  # angle, speed, brightness
-        
+            # (dx_unit, dy_unit, brightness) with speed baked in
+            particles.append((
+                speed * math.cos(angle),
+                speed * math.sin(angle),
+                random.uniform(0.7, 1.0)
+            ))
+
         return particles
     
     def animate(self):
@@ -252,22 +291,18 @@ class Explosion:
         # Calculate expansion and fade
         progress = self.current_frame / self.duration
         radius = self.max_radius * progress
-        alpha = int(255 * (1 - progress)) # alpha not used directly in RGB tuple unless we use RGBA
-        
+        fade = 1 - progress
+
         # Draw expanding particles
-        for angle, speed, brightness in self.particles:
-            particle_radius = radius * speed
-            px = self.x + particle_radius * math.cos(angle)
-            py = self.y + particle_radius * math.sin(angle)
-            
-            particle_size = 3
+        particle_size = 3
+        for dx_unit, dy_unit, brightness in self.particles:
+            px = self.x + radius * dx_unit
+            py = self.y + radius * dy_unit
+
             # Simple fade by darkening
-            color_intensity = brightness * (1 - progress)
-            color = tuple(int(c * color_intensity) for c in COLOR_EXPLOSION)
-            
-            # Ensure color values are valid
-            color = tuple(max(0, min(255, c)) for c in color)
-            
+            color_intensity = brightness * fade
+            color = tuple(max(0, min(255, int(c * color_intensity))) for c in COLOR_EXPLOSION)
+
             draw_context.ellipse(
                 [px - particle_size, py - particle_size, 
                  px + particle_size, py + particle_size],
@@ -2,8 +2,11 @@
 Main game state management and orchestration.
 """
 from typing import List, Optional
+
+import numpy as np
+
 from .game_entities import Ball, Paddle, Brick, Explosion
-from .physics import check_wall_collisions, check_paddle_collision, check_brick_collisions
+from .physics import advance_ball, check_brick_collisions
 from .models import ContributionData, RenderContext
 from .constants import *
 
@@ -24,6 +27,40 @@ class GameState:
         
         # Initialize entities
         self.bricks: List[Brick] = self._initialize_bricks()
+
+        # SoA view of the bricks for the jitted collision sweep: pixel bounds
+        # and an alive mask, index-aligned with self.bricks and updated only
+        # when a brick is destroyed.
+        self.brick_rects: np.ndarray = self._build_brick_rects()
+        self.brick_alive: np.ndarray = np.ones(len(self.bricks), dtype=np.uint8)
+        self._brick_index = {id(brick): i for i, brick in enumerate(self.bricks)}
+
+        # [row][col] spatial index for O(1) collision lookup; destroyed
+        # bricks are set back to None. Sized from the actual calendar:
+        # GitHub's trailing-year window returns 53 week columns whenever
+        # it does not start on a Sunday, so a 53rd column is the norm.
+        self.brick_grid: List[List[Optional[Brick]]] = [
+            [None] * self.num_week_cols for _ in range(NUM_DAYS)
+        ]
+        for brick in self.bricks:
+            self.brick_grid[brick.row][brick.col] = brick
+
+        # Row-band index: bricks grouped by row, for callers that want a
+        # whole band without scanning every brick (the collision path
+        # itself uses the cell grid above)
+        self.bricks_by_row: List[List[Brick]] = [[] for _ in range(NUM_DAYS)]
+        for brick in self.bricks:
+            self.bricks_by_row[brick.row].append(brick)
+
+        # Live-brick counters per column/row, decremented on destroy, so
+        # strategies can test a band in O(1) instead of scanning bricks
+        self._bricks_per_col: np.ndarray = np.bincount(
+            self.brick_cols, minlength=self.num_week_cols
+        )
+        self._bricks_per_row: np.ndarray = np.bincount(
+            self.brick_rows, minlength=NUM_DAYS
+        )
+
         self.ball: Ball = self._initialize_ball()
         self.paddle: Paddle = self._initialize_paddle()
         self.explosions: List[Explosion] = []
@@ -32,31 +69,78 @@ class GameState:
         self.frame_count = 0
         self.total_bricks = len(self.bricks)
         self.destroyed_bricks = 0
+
+        # Bricks hit since the renderer last consumed them (damaged bricks
+        # change color, destroyed ones must be erased from the base image)
+        self._dirty_bricks: List[Brick] = []
     
     def _initialize_bricks(self) -> List[Brick]:
-        """Create brick objects from contribution data."""
-        bricks = []
-        
-        for week_idx, week in enumerate(self.contribution_data.weeks):
-            for day_idx, day in enumerate(week.days):
-                if day.level == 0:
-                    # No contribution = no brick
-                    continue
-                
-                # Get brick properties from contribution level
-                brick_config = CONTRIBUTION_LEVELS[day.level]
-                
-                brick = Brick(
-                    col=week_idx,
-                    row=day_idx,
-                    strength=brick_config['strength'],
-                    color=brick_config['color'],
-                    contribution_count=day.count
-                )
-                bricks.append(brick)
-        
-        return bricks
+        """Create brick objects from contribution data.
+
+        Levels and counts are packed into (week, day) arrays first, and the
+        non-empty cells are selected with one nonzero() instead of testing
+        every cell in Python. The resulting SoA columns (brick_cols,
+        brick_rows, brick_strength) stay on the instance for vectorized
+        queries.
+        """
+        weeks = self.contribution_data.weeks
+        n_weeks = len(weeks)
+
+        # Actual column count of this calendar (at least NUM_WEEKS; real
+        # GitHub data usually has one extra partial week)
+        self.num_week_cols: int = max(NUM_WEEKS, n_weeks)
+
+        levels = np.zeros((n_weeks, NUM_DAYS), dtype=np.int8)
+        counts = np.zeros((n_weeks, NUM_DAYS), dtype=np.int32)
+        for week_idx, week in enumerate(weeks):
+            n_days = min(len(week.days), NUM_DAYS)
+            levels[week_idx, :n_days] = [day.level for day in week.days[:n_days]]
+            counts[week_idx, :n_days] = [day.count for day in week.days[:n_days]]
+
+        # Level 0 = no contribution = no brick
+        cols, rows = np.nonzero(levels)
+
+        self.brick_cols: np.ndarray = cols.astype(np.int16)
+        self.brick_rows: np.ndarray = rows.astype(np.int16)
+        self.brick_strength: np.ndarray = levels[cols, rows].astype(np.int16)
+
+        # Resolve the contiguous level tables to plain tuples/ints once;
+        # Bricks keep an RGB tuple because PIL fills want tuples
+        level_colors = [tuple(int(c) for c in row) for row in LEVEL_COLORS]
+        level_strength = LEVEL_STRENGTH.tolist()
+
+        return [
+            Brick(
+                col=int(col),
+                row=int(row),
+                strength=level_strength[level],
+                color=level_colors[level],
+                contribution_count=int(counts[col, row])
+            )
+            for col, row, level in zip(cols, rows, levels[cols, rows].tolist())
+        ]
     
+    def _build_brick_rects(self) -> np.ndarray:
+        """
+        Compute all brick pixel bounds into an (n, 4) float32 array.
+
+        The rectangles are a regular lattice, so they are derived from the
+        grid columns/rows with broadcast arithmetic rather than per-brick
+        method calls.
+        """
+        ctx = self.render_context
+        cell_block = ctx.cell_size + ctx.cell_spacing
+
+        cols = self.brick_cols.astype(np.float32)
+        rows = self.brick_rows.astype(np.float32)
+
+        rects = np.empty((len(self.bricks), 4), dtype=np.float32)
+        rects[:, 0] = ctx.padding_left + cols * cell_block          # left
+        rects[:, 1] = ctx.padding_top + rows * cell_block           # top
+        rects[:, 2] = rects[:, 0] + ctx.cell_size                   # right
+        rects[:, 3] = rects[:, 1] + ctx.cell_size                   # bottom
+        return rects
+
     def _initialize_ball(self) -> Ball:
         """Create initial ball."""
         # Start ball at center-bottom, moving upward at slight angle
@@ -76,7 +160,7 @@ class GameState:
     def _initialize_paddle(self) -> Paddle:
         """Create initial paddle."""
         start_x, start_y = self.render_context.grid_to_pixel(
-            NUM_WEEKS / 2,  # Center column
+            NUM_WEEKS // 2,  # Center column
             PADDLE_ROW
         )
         
@@ -103,25 +187,30 @@ class GameState:
         
         # Update paddle position
         self.paddle.animate()
-        
-        # Update ball position
-        self.ball.animate()
-        
-        # Check collisions
-        h_wall, v_wall = check_wall_collisions(self.ball)
+
+        # Advance ball and resolve wall/paddle contact in one fused call
+        h_wall, v_wall, paddle_hit = advance_ball(self.ball, self.paddle)
         events['wall_hit'] = h_wall or v_wall
-        
-        if check_paddle_collision(self.ball, self.paddle):
-            events['paddle_hit'] = True
-        
-        hit_brick = check_brick_collisions(self.ball, self.bricks, self.render_context)
+        events['paddle_hit'] = paddle_hit
+
+
+        hit_brick = check_brick_collisions(self.ball, self.brick_grid, self.render_context)
         if hit_brick:
             events['brick_hit'] = hit_brick
             was_destroyed = hit_brick.take_damage()
-            
+            self._dirty_bricks.append(hit_brick)
+
+            # Mirror the new strength into the SoA column
+            hit_index = self._brick_index[id(hit_brick)]
+            self.brick_strength[hit_index] = hit_brick.strength
+
             if was_destroyed:
                 events['brick_destroyed'] = True
                 self.destroyed_bricks += 1
+                self.brick_alive[hit_index] = 0
+                self.brick_grid[hit_brick.row][hit_brick.col] = None
+                self._bricks_per_col[hit_brick.col] -= 1
+                self._bricks_per_row[hit_brick.row] -= 1
                 
                 # Create explosion effect
                 brick_x, brick_y = self.render_context.grid_to_pixel(
@@ -130,11 +219,16 @@ class GameState:
                 )
                 self.explosions.append(Explosion(brick_x, brick_y))
         
-        # Update explosions
-        for explosion in self.explosions[:]:
-            explosion.animate()
-            if explosion.is_finished():
-                self.explosions.remove(explosion)
+        # Update explosions: single-pass rebuild instead of copy + O(n)
+        # remove per finished explosion. Most frames have none, so the
+        # truthiness guard skips the list build entirely.
+        if self.explosions:
+            alive = []
+            for explosion in self.explosions:
+                explosion.animate()
+                if not explosion.is_finished():
+                    alive.append(explosion)
+            self.explosions = alive
         
         self.frame_count += 1
         
@@ -150,38 +244,70 @@ class GameState:
     
     def is_complete(self) -> bool:
         """Check if all bricks are destroyed."""
-        return all(brick.is_destroyed() for brick in self.bricks)
-    
+        return not bool((self.brick_strength > 0).any())
+
     def get_active_bricks(self) -> List[Brick]:
         """Get list of bricks that are not destroyed."""
-        return [brick for brick in self.bricks if not brick.is_destroyed()]
+        return [self.bricks[i] for i in np.nonzero(self.brick_strength > 0)[0]]
+
+    def column_has_bricks(self, col: int) -> bool:
+        """Check if a column still has active bricks (O(1) counter test)."""
+        return self._bricks_per_col[col] > 0
+
+    def row_has_bricks(self, row: int) -> bool:
+        """Check if a row still has active bricks (O(1) counter test)."""
+        return self._bricks_per_row[row] > 0
+
+    def get_active_columns(self) -> List[int]:
+        """Get the sorted columns that still contain active bricks."""
+        return np.nonzero(self._bricks_per_col)[0].tolist()
     
+    def has_dirty_bricks(self) -> bool:
+        """Check if bricks were hit since the renderer last consumed them."""
+        return bool(self._dirty_bricks)
+
+    def consume_dirty_bricks(self) -> List[Brick]:
+        """Return and clear the bricks hit since the last call."""
+        dirty = self._dirty_bricks
+        self._dirty_bricks = []
+        return dirty
+
     def draw(self, draw_context, render_context: RenderContext):
         """Draw all game entities."""
+        self.draw_static(draw_context, render_context)
+
+        # Draw explosions (the Renderer stamps these from cached sprites
+        # instead; this path rasterizes them directly)
+        for explosion in self.explosions:
+            explosion.draw(draw_context, render_context)
+
+        self.draw_dynamic(draw_context, render_context)
+
+    def draw_static(self, draw_context, render_context: RenderContext):
+        """Draw the static scenery: grid background and bricks."""
         # Draw grid background
         self._draw_grid(draw_context, render_context)
-        
+
         # Draw bricks
         for brick in self.bricks:
             brick.draw(draw_context, render_context)
-        
-        # Draw explosions
-        for explosion in self.explosions:
-            explosion.draw(draw_context, render_context)
-        
+
+    def draw_dynamic(self, draw_context, render_context: RenderContext):
+        """Draw the paddle and ball (explosions are stamped by the Renderer)."""
         # Draw paddle
         self.paddle.draw(draw_context, render_context)
-        
+
         # Draw ball
         self.ball.draw(draw_context, render_context)
     
     def _draw_grid(self, draw_context, render_context: RenderContext):
-        """Draw background grid cells."""
+        """Draw background grid cells (once, into the renderer's base image)."""
+        grid_color = render_context.grid_color
         for week in range(NUM_WEEKS):
             for day in range(NUM_DAYS):
                 rect = render_context.get_cell_rect(week, day)
                 draw_context.rectangle(
                     rect,
-                    fill=render_context.grid_color,
-                    outline=render_context.grid_color
+                    fill=grid_color,
+                    outline=grid_color
                 )
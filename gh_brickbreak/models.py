@@ -2,9 +2,15 @@
 Data models and type definitions for Commit Breakout.
 """
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Dict
 from datetime import date
+
+import numpy as np
+
 from .constants import (
+    NUM_WEEKS,
+    NUM_DAYS,
     CELL_SIZE,
     CELL_SPACING,
     PADDING_TOP,
@@ -49,6 +55,21 @@ class ContributionData:
         return None
 
 
+# Grid geometry memoization. These live at module level (keyed on the
+# context's layout scalars) because RenderContext is a mutable dataclass
+# and cannot key an lru_cache itself. The grid is small and integer-keyed,
+# so the hot coordinate math collapses into a dict lookup.
+
+@lru_cache(maxsize=512)
+def _grid_to_pixel(col: float, row: float, cell_size: int, cell_spacing: int,
+                   padding_left: int, padding_top: int) -> tuple:
+    """Cached grid-to-pixel conversion (center of cell)."""
+    cell_block = cell_size + cell_spacing
+    x = padding_left + (col * cell_block) + (cell_size / 2)
+    y = padding_top + (row * cell_block) + (cell_size / 2)
+    return (x, y)
+
+
 @dataclass
 class Action:
     """Represents a paddle strategy action."""
@@ -77,18 +98,33 @@ class RenderContext:
         4: (57, 211, 83),
     })
     
+    def __post_init__(self):
+        # The cells form a regular lattice, so every rectangle is computed
+        # up front with broadcast arithmetic; get_cell_rect is then a
+        # constant array read.
+        cell_block = self.cell_size + self.cell_spacing
+        xs = self.padding_left + np.arange(NUM_WEEKS, dtype=np.int32) * cell_block
+        ys = self.padding_top + np.arange(NUM_DAYS, dtype=np.int32) * cell_block
+
+        self.cell_rects = np.empty((NUM_WEEKS, NUM_DAYS, 4), dtype=np.int32)
+        self.cell_rects[:, :, 0] = xs[:, None]                    # left
+        self.cell_rects[:, :, 1] = ys[None, :]                    # top
+        self.cell_rects[:, :, 2] = xs[:, None] + self.cell_size   # right
+        self.cell_rects[:, :, 3] = ys[None, :] + self.cell_size   # bottom
+
     def grid_to_pixel(self, col: float, row: float) -> tuple:
         """Convert grid coordinates to pixel coordinates (center of cell)."""
-        cell_block = self.cell_size + self.cell_spacing
-        x = self.padding_left + (col * cell_block) + (self.cell_size / 2)
-        y = self.padding_top + (row * cell_block) + (self.cell_size / 2)
-        return (x, y)
-    
+        return _grid_to_pixel(col, row, self.cell_size, self.cell_spacing,
+                              self.padding_left, self.padding_top)
+
     def get_cell_rect(self, col: int, row: int) -> tuple:
         """Get pixel rectangle for a grid cell (left, top, right, bottom)."""
+        if 0 <= col < NUM_WEEKS and 0 <= row < NUM_DAYS:
+            return tuple(self.cell_rects[col, row].tolist())
+
+        # Arithmetic fallback for cells outside the 52x7 lattice (a 53rd
+        # partial calendar week, or rows below the grid)
         cell_block = self.cell_size + self.cell_spacing
         left = self.padding_left + (col * cell_block)
         top = self.padding_top + (row * cell_block)
-        right = left + self.cell_size
-        bottom = top + self.cell_size
-        return (left, top, right, bottom)
+        return (left, top, left + self.cell_size, top + self.cell_size)
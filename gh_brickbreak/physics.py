@@ -1,153 +1,377 @@
 """
 Collision detection and physics calculations.
+
+The per-frame collision math runs in kernels that operate on plain floats
+and a structure-of-arrays view of the bricks, jitted with Numba when it is
+installed (the `jit` extra) and running as plain Python otherwise — the
+scalar arithmetic also JITs well under PyPy. Thin Python wrappers unpack
+the entity objects, call the kernels, and write results back, so the rest
+of the code keeps working with Ball/Paddle/Brick objects.
 """
 import math
 from typing import Optional, Tuple, List
+
+import numpy as np
+
+try:
+    # When this module runs as a Cython-compiled extension (the `aot`
+    # build), the kernels are already native code and Numba cannot wrap
+    # cython functions anyway — skip it even if it is installed.
+    import cython
+    _CYTHON_COMPILED = bool(cython.compiled)
+except ImportError:
+    _CYTHON_COMPILED = False
+
+NUMBA_AVAILABLE = False
+if not _CYTHON_COMPILED:
+    try:
+        from numba import njit
+        NUMBA_AVAILABLE = True
+    except ImportError:  # pragma: no cover - exercised on PyPy / minimal installs
+        # Pure-Python fast path: the kernels below are plain scalar
+        # arithmetic, so they run unmodified (and JIT well under PyPy)
+        # without Numba.
+        pass
+
+if not NUMBA_AVAILABLE:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when it is not used."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorate(func):
+            return func
+        return decorate
+
 from .game_entities import Ball, Paddle, Brick
 from .models import RenderContext
-from .constants import COLLISION_EPSILON, IMAGE_WIDTH, IMAGE_HEIGHT, PADDING_LEFT, PADDING_RIGHT, PADDING_TOP
+from .constants import (
+    COLLISION_EPSILON,
+    IMAGE_WIDTH,
+    IMAGE_HEIGHT,
+    PADDING_LEFT,
+    PADDING_RIGHT,
+    PADDING_TOP,
+    NUM_DAYS,
+)
+
+
+@njit(cache=True)
+def _wall_collide(x: float, y: float, vx: float, vy: float, r: float):
+    """
+    Jitted wall-collision kernel (branchless clamp + sign flip).
+
+    The position is clamped into the play field with min/max; a moved
+    coordinate means a wall was hit, and the velocity sign is taken from
+    the direction of the correction. LLVM lowers this to straight-line
+    code instead of four rarely-taken branches.
+
+    Returns:
+        (x, y, vx, vy, hit_horizontal, hit_vertical)
+    """
+    # Left/right walls
+    new_x = min(max(x, PADDING_LEFT + r), IMAGE_WIDTH - PADDING_RIGHT - r)
+    hit_horizontal = new_x != x
+    vx = math.copysign(vx, new_x - x) if hit_horizontal else vx
+
+    # Top wall
+    new_y = max(y, PADDING_TOP + r)
+    hit_vertical = new_y != y
+    vy = abs(vy) if hit_vertical else vy
+
+    # Bottom wall (shouldn't happen with paddle, but safety)
+    if y + r >= IMAGE_HEIGHT - 10:
+        vy = -abs(vy)
+        hit_vertical = True
+
+    return new_x, new_y, vx, vy, hit_horizontal, hit_vertical
+
+
+@njit(cache=True)
+def _paddle_overlap(bx: float, by: float, bvy: float, r: float,
+                    paddle_left: float, paddle_top: float,
+                    paddle_right: float, paddle_bottom: float) -> bool:
+    """Jitted paddle-overlap test. Only triggers while the ball descends."""
+    if bvy <= 0:
+        return False
+
+    # Check if ball overlaps paddle horizontally
+    if bx + r < paddle_left or bx - r > paddle_right:
+        return False
+
+    # Check if ball has reached paddle vertically
+    return by + r >= paddle_top and by - r < paddle_bottom
+
+
+@njit(cache=True)
+def _determine_collision_side(bx: float, by: float,
+                              brick_left: float, brick_top: float,
+                              brick_right: float, brick_bottom: float) -> bool:
+    """
+    Determine which side of the brick the ball hit.
+
+    Returns:
+        True for a horizontal hit (left/right), False for vertical (top/bottom).
+    """
+    brick_center_x = (brick_left + brick_right) / 2
+    brick_center_y = (brick_top + brick_bottom) / 2
+
+    dx = bx - brick_center_x
+    dy = by - brick_center_y
+
+    brick_half_width = (brick_right - brick_left) / 2
+    brick_half_height = (brick_bottom - brick_top) / 2
+
+    # Determine collision based on angle of approach
+    return abs(dx / brick_half_width) > abs(dy / brick_half_height)
+
+
+@njit(cache=True)
+def _brick_collide(bx: float, by: float, bvx: float, bvy: float, r: float,
+                   brick_rects: np.ndarray, brick_alive: np.ndarray):
+    """
+    Jitted AABB sweep over the brick rectangle array.
+
+    Args:
+        brick_rects: (n, 4) float32 array of (left, top, right, bottom)
+        brick_alive: (n,) uint8 mask of non-destroyed bricks
+
+    Returns:
+        (vx, vy, hit_index) with velocity reflected off the first hit brick,
+        or hit_index == -1 if no brick was hit.
+    """
+    ball_left = bx - r
+    ball_top = by - r
+    ball_right = bx + r
+    ball_bottom = by + r
+
+    for i in range(brick_rects.shape[0]):
+        if brick_alive[i] == 0:
+            continue
+
+        brick_left = brick_rects[i, 0]
+        brick_top = brick_rects[i, 1]
+        brick_right = brick_rects[i, 2]
+        brick_bottom = brick_rects[i, 3]
+
+        # AABB collision detection
+        if (ball_right < brick_left or
+                ball_left > brick_right or
+                ball_bottom < brick_top or
+                ball_top > brick_bottom):
+            continue
+
+        # Collision detected - bounce ball appropriately
+        if _determine_collision_side(bx, by, brick_left, brick_top,
+                                     brick_right, brick_bottom):
+            bvx = -bvx
+        else:
+            bvy = -bvy
+
+        return bvx, bvy, i
+
+    return bvx, bvy, -1
+
+
+@njit(cache=True)
+def _advance_ball(x: float, y: float, vx: float, vy: float, r: float,
+                  paddle_left: float, paddle_top: float,
+                  paddle_right: float, paddle_bottom: float):
+    """
+    Fused per-frame ball kernel: integrate the position, resolve wall
+    contact, and test paddle overlap in a single Python-to-JIT crossing
+    (every frame is rendered, so batching happens inside the frame rather
+    than across frames).
+
+    Returns:
+        (x, y, vx, vy, hit_horizontal, hit_vertical, paddle_hit)
+    """
+    x += vx
+    y += vy
+
+    x, y, vx, vy, hit_horizontal, hit_vertical = _wall_collide(x, y, vx, vy, r)
+    paddle_hit = _paddle_overlap(x, y, vy, r, paddle_left, paddle_top,
+                                 paddle_right, paddle_bottom)
+
+    return x, y, vx, vy, hit_horizontal, hit_vertical, paddle_hit
+
+
+def advance_ball(ball: Ball, paddle: Paddle) -> Tuple[bool, bool, bool]:
+    """
+    Advance the ball one frame and resolve wall and paddle contact.
+
+    Equivalent to ball.animate() + check_wall_collisions() +
+    check_paddle_collision(), but with one jitted call per frame instead
+    of three.
+
+    Args:
+        ball: Ball object
+        paddle: Paddle object
+
+    Returns:
+        (hit_horizontal, hit_vertical, paddle_hit)
+    """
+    paddle_left, paddle_top, paddle_right, paddle_bottom = paddle.get_bounds()
+
+    (ball.x, ball.y, ball.vx, ball.vy,
+     hit_horizontal, hit_vertical, paddle_hit) = _advance_ball(
+        ball.x, ball.y, ball.vx, ball.vy, ball.radius,
+        paddle_left, paddle_top, paddle_right, paddle_bottom
+    )
+
+    if paddle_hit:
+        # Calculate new velocity and position ball just above paddle to
+        # prevent re-collision
+        ball.vx, ball.vy = paddle.calculate_bounce_angle(ball.x)
+        ball.y = paddle_top - ball.radius
+
+    return hit_horizontal, hit_vertical, paddle_hit
+
+
+def warmup_kernels():
+    """
+    Trigger compilation of the jitted kernels with representative inputs.
+
+    Numba compiles lazily on first call; invoking this up front (the
+    Animator does, before the frame loop starts) keeps the one-time
+    compile cost out of the simulation. With cache=True later runs load
+    the cached machine code instead. No-op without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    _advance_ball(0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0)
+    _brick_collide(0.0, 0.0, 0.0, 0.0, 1.0,
+                   np.zeros((1, 4), dtype=np.float32),
+                   np.zeros(1, dtype=np.uint8))
+    _determine_collision_side(0.0, 0.0, 0.0, 0.0, 1.0, 1.0)
 
 
 def check_wall_collisions(ball: Ball) -> Tuple[bool, bool]:
     """
     Check and handle ball collisions with walls.
-    
+
     Args:
         ball: Ball object
-        
+
     Returns:
         (hit_horizontal, hit_vertical): Booleans indicating wall hits
     """
-    hit_horizontal = False
-    hit_vertical = False
-    
-    # Left wall
-    if ball.x - ball.radius <= PADDING_LEFT:
-        ball.x = PADDING_LEFT + ball.radius
-        ball.vx = abs(ball.vx)
-        hit_horizontal = True
-    
-    # Right wall
-    if ball.x + ball.radius >= IMAGE_WIDTH - PADDING_RIGHT:
-        ball.x = IMAGE_WIDTH - PADDING_RIGHT - ball.radius
-        ball.vx = -abs(ball.vx)
-        hit_horizontal = True
-    
-    # Top wall
-    if ball.y - ball.radius <= PADDING_TOP:
-        ball.y = PADDING_TOP + ball.radius
-        ball.vy = abs(ball.vy)
-        hit_vertical = True
-    
-    # Bottom wall (shouldn't happen with paddle, but safety)
-    if ball.y + ball.radius >= IMAGE_HEIGHT - 10:
-        ball.vy = -abs(ball.vy)
-        hit_vertical = True
-    
+    ball.x, ball.y, ball.vx, ball.vy, hit_horizontal, hit_vertical = _wall_collide(
+        ball.x, ball.y, ball.vx, ball.vy, ball.radius
+    )
     return hit_horizontal, hit_vertical
 
 
 def check_paddle_collision(ball: Ball, paddle: Paddle) -> bool:
     """
     Check and handle ball collision with paddle.
-    
+
     Args:
         ball: Ball object
         paddle: Paddle object
-        
+
     Returns:
         True if collision occurred
     """
-    # Only check if ball is moving downward
-    if ball.vy <= 0:
-        return False
-    
-    ball_left, ball_top, ball_right, ball_bottom = ball.get_bounds()
     paddle_left, paddle_top, paddle_right, paddle_bottom = paddle.get_bounds()
-    
-    # Check if ball overlaps paddle horizontally
-    if ball_right < paddle_left or ball_left > paddle_right:
+
+    if not _paddle_overlap(ball.x, ball.y, ball.vy, ball.radius,
+                           paddle_left, paddle_top, paddle_right, paddle_bottom):
         return False
-    
-    # Check if ball has reached paddle vertically
-    if ball_bottom >= paddle_top and ball_top < paddle_bottom:
-        # Collision! Calculate new velocity
-        ball.vx, ball.vy = paddle.calculate_bounce_angle(ball.x)
-        
-        # Position ball just above paddle to prevent re-collision
-        ball.y = paddle_top - ball.radius
-        
-        return True
-    
-    return False
 
+    # Collision! Calculate new velocity
+    ball.vx, ball.vy = paddle.calculate_bounce_angle(ball.x)
 
-def check_brick_collisions(ball: Ball, bricks: List[Brick], render_context: RenderContext) -> Optional[Brick]:
+    # Position ball just above paddle to prevent re-collision
+    ball.y = paddle_top - ball.radius
+
+    return True
+
+
+def check_brick_collisions(ball: Ball, brick_grid: List[List[Optional[Brick]]],
+                           render_context: RenderContext) -> Optional[Brick]:
     """
-    Check and handle ball collision with bricks.
-    
+    Check and handle ball collision with bricks via direct grid lookup.
+
+    The ball diameter is smaller than a grid cell, so it can only ever
+    overlap the 2x2 block of cells around its position. Looking those up
+    directly makes collision detection O(1) instead of a linear scan over
+    every brick.
+
     Args:
         ball: Ball object
-        bricks: List of active bricks
-        render_context: Rendering context for pixel coordinates
-        
+        brick_grid: [row][col] grid of bricks; destroyed slots are None
+        render_context: Rendering context for grid geometry
+
     Returns:
         Brick that was hit, or None
     """
+    cell_block = render_context.cell_size + render_context.cell_spacing
     ball_left, ball_top, ball_right, ball_bottom = ball.get_bounds()
-    
-    for brick in bricks:
-        if brick.is_destroyed():
-            continue
-        
-        brick_left, brick_top, brick_right, brick_bottom = brick.get_pixel_bounds(render_context)
-        
-        # AABB collision detection
-        if not (ball_right < brick_left or 
-                ball_left > brick_right or
-                ball_bottom < brick_top or
-                ball_top > brick_bottom):
-            
-            # Collision detected - determine collision side
-            collision_side = _determine_collision_side(
-                ball, brick, 
-                brick_left, brick_top, brick_right, brick_bottom
-            )
-            
-            # Bounce ball appropriately
-            if collision_side in ['top', 'bottom']:
-                ball.vy = -ball.vy
-            else:  # left or right
+
+    col_min = int((ball_left - render_context.padding_left) // cell_block)
+    col_max = int((ball_right - render_context.padding_left) // cell_block)
+    row_min = int((ball_top - render_context.padding_top) // cell_block)
+    row_max = int((ball_bottom - render_context.padding_top) // cell_block)
+
+    # Clamp to the grid's own width: real calendars often carry a 53rd
+    # partial week column beyond NUM_WEEKS
+    max_col = len(brick_grid[0]) - 1
+
+    for row in range(max(row_min, 0), min(row_max, NUM_DAYS - 1) + 1):
+        grid_row = brick_grid[row]
+        for col in range(max(col_min, 0), min(col_max, max_col) + 1):
+            brick = grid_row[col]
+            if brick is None:
+                continue
+
+            brick_left, brick_top, brick_right, brick_bottom = brick.get_pixel_bounds(render_context)
+
+            # AABB collision detection (the cell rect excludes the spacing
+            # gap, so the candidate can still miss)
+            if (ball_right < brick_left or
+                    ball_left > brick_right or
+                    ball_bottom < brick_top or
+                    ball_top > brick_bottom):
+                continue
+
+            # Collision detected - bounce ball appropriately
+            if _determine_collision_side(ball.x, ball.y, brick_left, brick_top,
+                                         brick_right, brick_bottom):
                 ball.vx = -ball.vx
-            
+            else:
+                ball.vy = -ball.vy
+
             return brick
-    
+
     return None
 
 
-def _determine_collision_side(ball: Ball, brick: Brick, 
-                              brick_left: float, brick_top: float,
-                              brick_right: float, brick_bottom: float) -> str:
+def check_brick_collisions_sweep(ball: Ball, bricks: List[Brick],
+                                 brick_rects: np.ndarray,
+                                 brick_alive: np.ndarray) -> Optional[Brick]:
     """
-    Determine which side of the brick the ball hit.
-    
+    Linear-sweep fallback for brick collision over the SoA arrays.
+
+    Kept for callers without the cell grid; the grid lookup in
+    check_brick_collisions is preferred.
+
+    Args:
+        ball: Ball object
+        bricks: List of bricks (index-aligned with the bounds arrays)
+        brick_rects: (n, 4) float32 array of brick pixel bounds
+        brick_alive: (n,) uint8 mask of non-destroyed bricks
+
     Returns:
-        'top', 'bottom', 'left', or 'right'
+        Brick that was hit, or None
     """
-    # Calculate distances from ball center to each side
-    brick_center_x = (brick_left + brick_right) / 2
-    brick_center_y = (brick_top + brick_bottom) / 2
-    
-    dx = ball.x - brick_center_x
-    dy = ball.y - brick_center_y
-    
-    brick_half_width = (brick_right - brick_left) / 2
-    brick_half_height = (brick_bottom - brick_top) / 2
-    
-    # Determine collision based on angle of approach
-    if abs(dx / brick_half_width) > abs(dy / brick_half_height):
-        # Hit from left or right
-        return 'left' if dx < 0 else 'right'
-    else:
-        # Hit from top or bottom
-        return 'top' if dy < 0 else 'bottom'
+    ball.vx, ball.vy, hit_index = _brick_collide(
+        ball.x, ball.y, ball.vx, ball.vy, ball.radius,
+        brick_rects, brick_alive
+    )
+
+    if hit_index < 0:
+        return None
+
+    return bricks[hit_index]
@@ -1,11 +1,42 @@
 """
 PIL-based rendering engine.
 """
+from functools import lru_cache
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from typing import Generator
 from .models import RenderContext
 from .game_state import GameState
-from .constants import IMAGE_WIDTH, IMAGE_HEIGHT
+from .constants import IMAGE_WIDTH, IMAGE_HEIGHT, COLOR_EXPLOSION
+
+# Explosion fades are bucketed into this many intensity steps so particle
+# sprites can be cached and stamped instead of rasterized per frame
+_EXPLOSION_FADE_STEPS = 16
+
+# Pillow-SIMD is an API-compatible drop-in whose vectorized loops speed up
+# the copy/paste/quantize paths; it versions itself with a '.postN' suffix.
+# Exposed for diagnostics — no code changes are needed either way.
+USING_PILLOW_SIMD = 'post' in getattr(Image, '__version__', '')
+
+
+@lru_cache(maxsize=64)
+def _particle_sprite(size: int, fade_step: int) -> Image.Image:
+    """Cached RGBA disc sprite for an explosion particle at a fade step."""
+    color = tuple(int(c * fade_step / _EXPLOSION_FADE_STEPS) for c in COLOR_EXPLOSION)
+    sprite = Image.new('RGBA', (size * 2 + 1, size * 2 + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    draw.ellipse([0, 0, size * 2, size * 2], fill=color + (255,))
+    return sprite
+
+
+@lru_cache(maxsize=16)
+def _flash_sprite(size: int) -> Image.Image:
+    """Cached white center-flash sprite."""
+    sprite = Image.new('RGBA', (size * 2 + 1, size * 2 + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    draw.ellipse([0, 0, size * 2, size * 2], fill=(255, 255, 255, 255))
+    return sprite
 
 
 class Renderer:
@@ -14,89 +45,237 @@ class Renderer:
     def __init__(self, render_context: RenderContext):
         """
         Initialize renderer.
-        
+
         Args:
             render_context: Rendering configuration
         """
         self.context = render_context
-        self.width = int(IMAGE_WIDTH)
-        self.height = int(IMAGE_HEIGHT)
-    
+        # The image dimension constants are already ints
+        self.width = IMAGE_WIDTH
+        self.height = IMAGE_HEIGHT
+
+        # Cached base image (background + grid + bricks). Only the cells of
+        # bricks that were hit get repainted between frames, so per-frame
+        # work is one blit plus the handful of moving entities.
+        self._base: Image.Image = None
+
+        # Persistent frame canvas. Instead of copying the whole base every
+        # frame, the canvas is kept across frames and only the rectangles
+        # the previous frame's moving entities touched are restored from
+        # the base. The returned image is therefore only valid until the
+        # next render_frame() call.
+        self._canvas: Image.Image = None
+        self._prev_dynamic_rects: list = []
+
+        # Cached watermark sprite: the text is fixed for a run, so it is
+        # rasterized once and pasted per frame (font rasterization is the
+        # expensive part of text drawing)
+        self._watermark_text: str = None
+        self._watermark_sprite: Image.Image = None
+        self._watermark_pos: tuple = None
+
+    def _ensure_base(self, game_state: GameState):
+        """Build the static base image on first use."""
+        if self._base is not None:
+            return
+
+        # Fill the background through a NumPy array rather than Image.new's
+        # per-pixel fill; fromarray wraps the buffer without another copy.
+        # This only runs once — every later frame reuses the canvas.
+        bg = np.full(
+            (self.height, self.width, 3),
+            self.context.background_color,
+            dtype=np.uint8
+        )
+        base = Image.fromarray(bg, 'RGB')
+        draw = ImageDraw.Draw(base)
+        game_state.draw_static(draw, self.context)
+
+        self._base = base
+
+    def _clamp_rect(self, left: float, top: float, right: float, bottom: float) -> tuple:
+        """Clamp a bounding box to the image, as an exclusive crop box."""
+        return (
+            max(int(left), 0),
+            max(int(top), 0),
+            min(int(right) + 2, self.width),
+            min(int(bottom) + 2, self.height)
+        )
+
+    def _apply_dirty_bricks(self, game_state: GameState) -> list:
+        """Repaint cells of bricks hit since the last frame onto the base.
+
+        Returns:
+            Crop boxes of the repainted cells, for restoring the canvas.
+        """
+        dirty = game_state.consume_dirty_bricks()
+        if not dirty:
+            return []
+
+        rects = []
+        draw = ImageDraw.Draw(self._base)
+        for brick in dirty:
+            rect = brick.get_pixel_bounds(self.context)
+            if brick.is_destroyed():
+                # Restore the empty grid cell
+                draw.rectangle(
+                    rect,
+                    fill=self.context.grid_color,
+                    outline=self.context.grid_color
+                )
+            else:
+                # Repaint with the damaged (faded) color
+                brick.draw(draw, self.context)
+            rects.append(self._clamp_rect(*rect))
+
+        return rects
+
+    def _stamp_explosions(self, img: Image.Image, game_state: GameState,
+                          dirty_rects: list):
+        """Stamp explosion particles onto the frame from cached sprites.
+
+        Replaces per-particle ellipse rasterization with a paste per
+        particle; intensities are bucketed so the sprite cache stays small.
+        Each explosion's bounding box is appended to dirty_rects.
+        """
+        particle_size = 3
+        for explosion in game_state.explosions:
+            if explosion.is_finished():
+                continue
+
+            progress = explosion.current_frame / explosion.duration
+            radius = explosion.max_radius * progress
+            fade = 1 - progress
+
+            for dx_unit, dy_unit, brightness in explosion.particles:
+                fade_step = int(brightness * fade * _EXPLOSION_FADE_STEPS + 0.5)
+                if fade_step <= 0:
+                    continue
+
+                px = int(explosion.x + radius * dx_unit)
+                py = int(explosion.y + radius * dy_unit)
+                sprite = _particle_sprite(particle_size, fade_step)
+                img.paste(sprite, (px - particle_size, py - particle_size), sprite)
+
+            # Center flash for the first half of the animation
+            if explosion.current_frame < explosion.duration / 2:
+                flash_size = int(5 * (1 - progress * 2))
+                if flash_size > 0:
+                    sprite = _flash_sprite(flash_size)
+                    img.paste(
+                        sprite,
+                        (int(explosion.x) - flash_size, int(explosion.y) - flash_size),
+                        sprite
+                    )
+
+            # Everything stamped lies within max_radius scaled by the
+            # fastest particle, plus the sprite extent
+            spread = max(max(abs(dx), abs(dy)) for dx, dy, _ in explosion.particles)
+            reach = explosion.max_radius * max(spread, 1.0) + particle_size * 2 + 1
+            dirty_rects.append(self._clamp_rect(
+                explosion.x - reach, explosion.y - reach,
+                explosion.x + reach, explosion.y + reach
+            ))
+
     def render_frame(self, game_state: GameState) -> Image.Image:
         """
         Render current game state to PIL Image.
-        
+
+        The returned image is the renderer's persistent canvas and is
+        overwritten by the next call — callers that keep frames around
+        (the GIF writer quantizes each one immediately) must not hold
+        onto it across frames.
+
         Args:
             game_state: Current game state
-            
+
         Returns:
             PIL Image object
         """
-        # Create base image with background color
-        img = Image.new(
-            'RGB',
-            (self.width, self.height),
-            self.context.background_color
-        )
-        
-        # Create transparent overlay for drawing
-        overlay = Image.new(
-            'RGBA',
-            (self.width, self.height),
-            (0, 0, 0, 0)
-        )
-        
-        draw = ImageDraw.Draw(overlay)
-        
-        # Draw all game entities
-        game_state.draw(draw, self.context)
-        
-        # Composite overlay onto base image
-        img = img.convert('RGBA')
-        img = Image.alpha_composite(img, overlay)
-        
-        # Convert to RGB for GIF
-        img = img.convert('RGB')
-        
+        self._ensure_base(game_state)
+        restore_rects = self._apply_dirty_bricks(game_state)
+
+        # Reuse the persistent canvas: restore only the rectangles the
+        # previous frame's moving entities (and any repainted brick cells)
+        # touched, instead of copying the whole base every frame.
+        if self._canvas is None:
+            self._canvas = self._base.copy()
+        else:
+            restore_rects += self._prev_dynamic_rects
+            for rect in restore_rects:
+                self._canvas.paste(self._base.crop(rect), rect)
+
+        img = self._canvas
+
+        # Stamp explosions from cached sprites first so paddle/ball draw
+        # over them, then draw the remaining entities; record every box
+        # touched so the next frame can restore just those pixels.
+        dynamic_rects = []
+        self._stamp_explosions(img, game_state, dynamic_rects)
+        draw = ImageDraw.Draw(img)
+        game_state.draw_dynamic(draw, self.context)
+        dynamic_rects.append(self._clamp_rect(*game_state.ball.get_bounds()))
+        dynamic_rects.append(self._clamp_rect(*game_state.paddle.get_bounds()))
+        self._prev_dynamic_rects = dynamic_rects
+
         return img
     
+    def _build_watermark_sprite(self, text: str):
+        """Rasterize the watermark text (shadow + fill) into an RGBA sprite."""
+        font = ImageFont.load_default()
+
+        # Rasterize the glyph run once; the shadow and fill passes then
+        # reuse the same mask instead of re-rendering the text per color
+        mask = font.getmask(text, mode='L')
+        text_width, text_height = mask.size
+        mask_img = Image.frombytes('L', mask.size, bytes(mask))
+
+        # Paste the colors through the mask with a slight shadow offset
+        # for visibility (+1 px each way)
+        shadow_color = (0, 0, 0)
+        text_color = (150, 150, 150)
+
+        sprite = Image.new('RGBA', (text_width + 2, text_height + 2), (0, 0, 0, 0))
+        sprite.paste(shadow_color + (255,), (1, 1), mask_img)
+        sprite.paste(text_color + (255,), (0, 0), mask_img)
+
+        self._watermark_text = text
+        self._watermark_sprite = sprite
+        # Position in bottom-right corner; the mask is tight, so the
+        # font's bearing offsets keep the glyphs where draw.text would
+        # have put them
+        offset_x, offset_y, _, _ = font.getbbox(text)
+        self._watermark_pos = (
+            self.width - text_width - 10 + offset_x,
+            self.height - text_height - 10 + offset_y
+        )
+
     def add_watermark(self, img: Image.Image, text: str) -> Image.Image:
         """
         Add watermark text to image.
-        
+
+        The text is rasterized once into a cached sprite; each call is
+        then a single alpha-masked paste.
+
         Args:
             img: PIL Image
             text: Watermark text
-            
+
         Returns:
             Modified PIL Image
         """
-        draw = ImageDraw.Draw(img)
-        
-        # Load font if possible, else use default
-        try:
-            font = ImageFont.load_default()
-        except IOError:
-            font = None
-            
-        # Position in bottom-right corner
-        if hasattr(draw, 'textbbox'): # Pillow >= 9.2.0
-            text_bbox = draw.textbbox((0, 0), text, font=font)
-        else: # Older Pillow
-             text_bbox = draw.textsize(text, font=font)
-             text_bbox = (0, 0, text_bbox[0], text_bbox[1])
-
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
-        
-        x = self.width - text_width - 10
-        y = self.height - text_height - 10
-        
-        # Draw text with slight shadow for visibility
-        shadow_color = (0, 0, 0)
-        text_color = (150, 150, 150)
-        
-        draw.text((x + 1, y + 1), text, fill=shadow_color, font=font)
-        draw.text((x, y), text, fill=text_color, font=font)
-        
+        if text != self._watermark_text:
+            self._build_watermark_sprite(text)
+
+        sprite = self._watermark_sprite
+        img.paste(sprite, self._watermark_pos, sprite)
+
+        # The sprite's anti-aliased edges blend with whatever is under
+        # them, so re-pasting over a previous paste would darken the
+        # edges every frame. Record the rect for the canvas restore pass
+        # so each paste lands on clean base pixels.
+        x, y = self._watermark_pos
+        self._prev_dynamic_rects.append(
+            self._clamp_rect(x, y, x + sprite.width, y + sprite.height)
+        )
         return img
@@ -65,23 +65,13 @@ class ColumnStrategy(BaseStrategy):
     
     def generate_actions(self, game_state: GameState) -> Iterator[Action]:
         """Clear columns systematically."""
-        # Get all columns that have bricks
-        active_columns = self._get_active_columns(game_state)
-        
-        for col in sorted(active_columns):
+        # Get all columns that have bricks (vectorized SoA query)
+        for col in game_state.get_active_columns():
             # Target this column until all bricks in it are destroyed
-            while self._column_has_bricks(game_state, col):
+            while game_state.column_has_bricks(col):
                 # Convert grid column to pixel x
                 target_x, _ = game_state.render_context.grid_to_pixel(col, 0)
                 yield Action(target_x=target_x)
-    
-    def _get_active_columns(self, game_state: GameState) -> set:
-        """Get set of columns that contain active bricks."""
-        return {brick.col for brick in game_state.get_active_bricks()}
-    
-    def _column_has_bricks(self, game_state: GameState, col: int) -> bool:
-        """Check if column still has bricks."""
-        return any(brick.col == col for brick in game_state.get_active_bricks())
 
 
 class RowStrategy(BaseStrategy):
@@ -96,12 +86,16 @@ class RowStrategy(BaseStrategy):
         
         # Process rows from bottom to top (row 6 down to row 0)
         for row_idx in range(NUM_DAYS - 1, -1, -1):
-            # Get all bricks in this row
+            # O(1) counter test before touching the row band at all
+            if not game_state.row_has_bricks(row_idx):
+                continue
+
+            # Get all active bricks in this row from the row-band index
             row_bricks = [
-                brick for brick in game_state.get_active_bricks()
-                if brick.row == row_idx
+                brick for brick in game_state.bricks_by_row[row_idx]
+                if not brick.is_destroyed()
             ]
-            
+
             if not row_bricks:
                 continue
             
@@ -0,0 +1,30 @@
+"""
+Optional Cython-accelerated build.
+
+A plain `pip install .` stays pure Python (metadata lives in
+pyproject.toml). Setting GH_BRICKBREAK_CYTHONIZE=1 with Cython installed
+(the `aot` extra) AOT-compiles the hot modules instead, which gives
+Numba-like speed on the scalar physics with no import or first-call JIT
+warmup — useful for the one-shot CLI where Numba's compile time can rival
+the render itself.
+"""
+import os
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get('GH_BRICKBREAK_CYTHONIZE') == '1':
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            'gh_brickbreak/physics.py',
+            'gh_brickbreak/game_entities.py',
+        ],
+        language_level=3,
+        compiler_directives={
+            'boundscheck': False,
+            'cdivision': True,
+        },
+    )
+
+setup(ext_modules=ext_modules)
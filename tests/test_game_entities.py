@@ -2,8 +2,8 @@
 Unit tests for game entities.
 """
 import pytest
-from commit_breakout.game_entities import Ball, Paddle, Brick
-from commit_breakout.models import RenderContext
+from gh_brickbreak.game_entities import Ball, Paddle, Brick
+from gh_brickbreak.models import RenderContext
 
 
 def test_ball_initialization():
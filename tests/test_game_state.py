@@ -0,0 +1,59 @@
+"""
+Unit tests for game state construction.
+"""
+from datetime import date
+
+from gh_brickbreak.game_state import GameState
+from gh_brickbreak.game_entities import Ball
+from gh_brickbreak.models import (
+    ContributionData,
+    ContributionWeek,
+    ContributionDay,
+    RenderContext,
+)
+from gh_brickbreak.physics import check_brick_collisions
+from gh_brickbreak.constants import NUM_WEEKS, NUM_DAYS
+
+
+def _make_contribution_data(n_weeks):
+    """Build a calendar with one level-1 brick in each week's first day."""
+    weeks = [
+        ContributionWeek(days=[
+            ContributionDay(
+                date=date(2025, 1, 1),
+                count=1 if day == 0 else 0,
+                level=1 if day == 0 else 0,
+            )
+            for day in range(NUM_DAYS)
+        ])
+        for _ in range(n_weeks)
+    ]
+    return ContributionData(
+        username='test',
+        total_contributions=n_weeks,
+        weeks=weeks,
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 12, 31),
+    )
+
+
+def test_53_week_calendar_builds_and_tracks_last_column():
+    """GitHub's trailing-year window usually returns 53 week columns."""
+    state = GameState(_make_contribution_data(NUM_WEEKS + 1), RenderContext())
+
+    assert state.num_week_cols == NUM_WEEKS + 1
+    assert state.brick_grid[0][NUM_WEEKS] is not None
+    assert state.column_has_bricks(NUM_WEEKS)
+    assert NUM_WEEKS in state.get_active_columns()
+
+
+def test_53rd_column_brick_is_hittable():
+    """The grid collision clamp must cover the extra partial week."""
+    state = GameState(_make_contribution_data(NUM_WEEKS + 1), RenderContext())
+    brick = state.brick_grid[0][NUM_WEEKS]
+
+    left, top, right, bottom = brick.get_pixel_bounds(state.render_context)
+    ball = Ball((left + right) / 2, bottom + 2, 0.0, -3.0)
+
+    hit = check_brick_collisions(ball, state.brick_grid, state.render_context)
+    assert hit is brick
@@ -0,0 +1,143 @@
+"""
+Unit tests for collision physics.
+"""
+import numpy as np
+import pytest
+from gh_brickbreak.game_entities import Ball, Paddle, Brick
+from gh_brickbreak.models import RenderContext
+from gh_brickbreak.physics import (
+    check_wall_collisions,
+    check_paddle_collision,
+    check_brick_collisions,
+    check_brick_collisions_sweep,
+)
+from gh_brickbreak.constants import PADDING_LEFT, PADDING_TOP, NUM_WEEKS, NUM_DAYS
+
+
+def _make_brick_grid(bricks):
+    """Build the [row][col] spatial index check_brick_collisions expects."""
+    grid = [[None] * NUM_WEEKS for _ in range(NUM_DAYS)]
+    for brick in bricks:
+        grid[brick.row][brick.col] = brick
+    return grid
+
+
+def _make_brick_arrays(bricks, render_context):
+    """Build the SoA bounds/alive arrays the collision sweep expects."""
+    rects = np.empty((len(bricks), 4), dtype=np.float32)
+    for i, brick in enumerate(bricks):
+        rects[i] = brick.get_pixel_bounds(render_context)
+    alive = np.ones(len(bricks), dtype=np.uint8)
+    return rects, alive
+
+
+def test_wall_collision_left():
+    """Test ball bounces off left wall."""
+    ball = Ball(PADDING_LEFT + 1, 100, -2.0, 1.0)
+    hit_h, hit_v = check_wall_collisions(ball)
+    assert hit_h
+    assert not hit_v
+    assert ball.vx > 0
+    assert ball.x >= PADDING_LEFT + ball.radius
+
+
+def test_wall_collision_top():
+    """Test ball bounces off top wall."""
+    ball = Ball(200, PADDING_TOP + 1, 1.0, -2.0)
+    hit_h, hit_v = check_wall_collisions(ball)
+    assert hit_v
+    assert not hit_h
+    assert ball.vy > 0
+
+
+def test_no_wall_collision_in_open_field():
+    """Test ball in open field is untouched."""
+    ball = Ball(200, 100, 1.5, -1.5)
+    hit_h, hit_v = check_wall_collisions(ball)
+    assert not hit_h
+    assert not hit_v
+    assert ball.vx == 1.5
+    assert ball.vy == -1.5
+
+
+def test_paddle_collision_bounces_upward():
+    """Test descending ball bounces off paddle."""
+    paddle = Paddle(100, 200, 60)
+    ball = Ball(100, 198, 0.0, 3.0)
+    assert check_paddle_collision(ball, paddle)
+    assert ball.vy < 0
+    assert ball.y == 200 - ball.radius
+
+
+def test_paddle_collision_ignores_ascending_ball():
+    """Test ascending ball passes through paddle zone."""
+    paddle = Paddle(100, 200, 60)
+    ball = Ball(100, 198, 0.0, -3.0)
+    assert not check_paddle_collision(ball, paddle)
+
+
+def test_advance_ball_fused_step():
+    """Test the fused step moves the ball and handles paddle contact."""
+    from gh_brickbreak.physics import advance_ball
+
+    paddle = Paddle(100, 200, 60)
+    ball = Ball(100, 194, 0.0, 3.0)
+
+    hit_h, hit_v, paddle_hit = advance_ball(ball, paddle)
+    assert paddle_hit
+    assert not hit_h
+    assert ball.vy < 0
+    assert ball.y == 200 - ball.radius
+
+    # Open-field step just integrates position
+    ball = Ball(200, 100, 1.5, -1.5)
+    hit_h, hit_v, paddle_hit = advance_ball(ball, paddle)
+    assert not (hit_h or hit_v or paddle_hit)
+    assert ball.x == 201.5
+    assert ball.y == 98.5
+
+
+def test_brick_collision_hits_and_reflects():
+    """Test ball hits a brick via grid lookup and reflects velocity."""
+    ctx = RenderContext()
+    brick = Brick(0, 0, strength=1, color=(0, 255, 0), contribution_count=1)
+    grid = _make_brick_grid([brick])
+
+    left, top, right, bottom = brick.get_pixel_bounds(ctx)
+    center_x = (left + right) / 2
+    ball = Ball(center_x, bottom + 2, 0.0, -3.0)
+
+    hit = check_brick_collisions(ball, grid, ctx)
+    assert hit is brick
+    assert ball.vy > 0  # Reflected downward
+
+
+def test_brick_collision_skips_destroyed_slots():
+    """Test destroyed (None) grid slots are ignored."""
+    ctx = RenderContext()
+    brick = Brick(0, 0, strength=1, color=(0, 255, 0), contribution_count=1)
+    grid = _make_brick_grid([brick])
+    grid[brick.row][brick.col] = None
+
+    left, top, right, bottom = brick.get_pixel_bounds(ctx)
+    ball = Ball((left + right) / 2, bottom + 2, 0.0, -3.0)
+
+    assert check_brick_collisions(ball, grid, ctx) is None
+
+
+def test_brick_collision_sweep_fallback():
+    """Test the linear SoA sweep fallback matches the grid path."""
+    ctx = RenderContext()
+    brick = Brick(2, 3, strength=1, color=(0, 255, 0), contribution_count=1)
+    rects, alive = _make_brick_arrays([brick], ctx)
+
+    left, top, right, bottom = brick.get_pixel_bounds(ctx)
+    ball = Ball((left + right) / 2, bottom + 2, 0.0, -3.0)
+
+    hit = check_brick_collisions_sweep(ball, [brick], rects, alive)
+    assert hit is brick
+    assert ball.vy > 0
+
+    alive[0] = 0
+    ball = Ball((left + right) / 2, bottom + 2, 0.0, -3.0)
+    assert check_brick_collisions_sweep(ball, [brick], rects, alive) is None